@@ -4,6 +4,9 @@
 #
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
+import itertools
+import operator
+
 from . import attributes
 from . import interfaces
 from . import loading
@@ -44,6 +47,17 @@ _EMPTY_DICT = util.immutabledict()
 
 LABEL_STYLE_LEGACY_ORM = util.symbol("LABEL_STYLE_LEGACY_ORM")
 
+# fetches the load options copied onto each QueryContext in one call
+_load_options_getter = operator.attrgetter(
+    "_autoflush",
+    "_populate_existing",
+    "_invoke_all_eagers",
+    "_version_check",
+    "_refresh_state",
+    "_yield_per",
+    "_refresh_identity_token",
+)
+
 
 class QueryContext(object):
     __slots__ = (
@@ -102,19 +116,26 @@ class QueryContext(object):
         self.loaders_require_uniquing = False
         self.params = params
 
-        self.propagated_loader_options = {
-            o for o in statement._with_options if o.propagate_to_loaders
-        }
+        # most statements have no options at all; share the empty set
+        # in that case, which also becomes InstanceState.load_options
+        if statement._with_options:
+            self.propagated_loader_options = {
+                o for o in statement._with_options if o.propagate_to_loaders
+            }
+        else:
+            self.propagated_loader_options = util.EMPTY_SET
 
-        self.attributes = dict(compile_state.attributes)
+        self.attributes = compile_state.attributes.copy()
 
-        self.autoflush = load_options._autoflush
-        self.populate_existing = load_options._populate_existing
-        self.invoke_all_eagers = load_options._invoke_all_eagers
-        self.version_check = load_options._version_check
-        self.refresh_state = load_options._refresh_state
-        self.yield_per = load_options._yield_per
-        self.identity_token = load_options._refresh_identity_token
+        (
+            self.autoflush,
+            self.populate_existing,
+            self.invoke_all_eagers,
+            self.version_check,
+            self.refresh_state,
+            self.yield_per,
+            self.identity_token,
+        ) = _load_options_getter(load_options)
 
         if self.yield_per and compile_state._no_yield_pers:
             raise sa_exc.InvalidRequestError(
@@ -131,11 +152,17 @@ _orm_load_exec_options = util.immutabledict(
     {"_result_disable_adapt_to_context": True, "future_result": True}
 )
 
+# compile option changes applied during compilation
+_disable_eagerloads = util.immutabledict({"_enable_eagerloads": False})
+_disable_single_crit = util.immutabledict({"_enable_single_crit": False})
+
 
 class ORMCompileState(CompileState):
-    # note this is a dictionary, but the
-    # default_compile_options._with_polymorphic_adapt_map is a tuple
-    _with_polymorphic_adapt_map = _EMPTY_DICT
+    # attributes are declared as __slots__ on the concrete
+    # ORMFromStatementCompileState / ORMSelectCompileState classes;
+    # this base contributes no instance layout so that it can be combined
+    # with SelectState.
+    __slots__ = ()
 
     class default_compile_options(CacheableOptions):
         _cache_key_traversal = [
@@ -177,8 +204,6 @@ class ORMCompileState(CompileState):
         _set_base_alias = False
         _for_refresh_state = False
 
-    current_path = _path_registry
-
     def __init__(self, *arg, **kw):
         raise NotImplementedError()
 
@@ -340,24 +365,52 @@ class ORMCompileState(CompileState):
                 )
 
     def _mapper_loads_polymorphically_with(self, mapper, adapter):
-        for m2 in mapper._with_polymorphic_mappers or [mapper]:
-            self._polymorphic_adapters[m2] = adapter
-            for m in m2.iterate_to_root():  # TODO: redundant ?
-                self._polymorphic_adapters[m.local_table] = adapter
+        polymorphic_adapters = self._polymorphic_adapters
+        seen = set()
+        for m2 in mapper._with_polymorphic_mappers or (mapper,):
+            polymorphic_adapters[m2] = adapter
+            for m in m2.iterate_to_root():
+                if m in seen:
+                    # m and everything above it were already
+                    # assigned from a sibling mapper
+                    break
+                seen.add(m)
+                polymorphic_adapters[m.local_table] = adapter
 
 
 @sql.base.CompileState.plugin_for("orm", "orm_from_statement")
 class ORMFromStatementCompileState(ORMCompileState):
-    _aliased_generations = util.immutabledict()
-    _from_obj_alias = None
-    _has_mapper_entities = False
-
-    _has_orm_entities = False
-    multi_row_eager_loaders = False
-    compound_eager_adapter = None
-
-    extra_criteria_entities = _EMPTY_DICT
-    eager_joins = _EMPTY_DICT
+    __slots__ = (
+        "statement_container",
+        "select_statement",
+        "requested_statement",
+        "dml_table",
+        "use_legacy_query_style",
+        "compile_options",
+        "current_path",
+        "attributes",
+        "global_attributes",
+        "_label_convention",
+        "_entities",
+        "_primary_entity",
+        "_polymorphic_adapters",
+        "_with_polymorphic_adapt_map",
+        "_aliased_generations",
+        "_from_obj_alias",
+        "_has_mapper_entities",
+        "_has_orm_entities",
+        "_no_yield_pers",
+        "multi_row_eager_loaders",
+        "compound_eager_adapter",
+        "extra_criteria_entities",
+        "eager_joins",
+        "primary_columns",
+        "secondary_columns",
+        "create_eager_joins",
+        "_fallback_from_clauses",
+        "_current_adapter",
+        "order_by",
+    )
 
     @classmethod
     def create_for_statement(cls, statement_container, compiler, **kw):
@@ -369,6 +422,16 @@ class ORMFromStatementCompileState(ORMCompileState):
 
         self = cls.__new__(cls)
         self._primary_entity = None
+        self._with_polymorphic_adapt_map = _EMPTY_DICT
+        self._aliased_generations = _EMPTY_DICT
+        self._from_obj_alias = None
+        self._has_mapper_entities = False
+        self._has_orm_entities = False
+        self.multi_row_eager_loaders = False
+        self.compound_eager_adapter = None
+        self.extra_criteria_entities = _EMPTY_DICT
+        self.eager_joins = _EMPTY_DICT
+        self._current_adapter = None
 
         self.use_legacy_query_style = (
             statement_container._compile_options._use_legacy_query_style
@@ -381,7 +444,7 @@ class ORMFromStatementCompileState(ORMCompileState):
 
         self._entities = []
         self._polymorphic_adapters = {}
-        self._no_yield_pers = set()
+        self._no_yield_pers = None
 
         self.compile_options = statement_container._compile_options
 
@@ -475,25 +538,77 @@ class ORMFromStatementCompileState(ORMCompileState):
 
 @sql.base.CompileState.plugin_for("orm", "select")
 class ORMSelectCompileState(ORMCompileState, SelectState):
-    _joinpath = _joinpoint = _EMPTY_DICT
-
-    _from_obj_alias = None
-    _has_mapper_entities = False
-
-    _has_orm_entities = False
-    multi_row_eager_loaders = False
-    compound_eager_adapter = None
+    __slots__ = (
+        "select_statement",
+        "for_statement",
+        "use_legacy_query_style",
+        "compile_options",
+        "label_style",
+        "current_path",
+        "attributes",
+        "global_attributes",
+        "_label_convention",
+        "_entities",
+        "_primary_entity",
+        "_polymorphic_adapters",
+        "_with_polymorphic_adapt_map",
+        "_aliased_generations",
+        "_from_obj_alias",
+        "_has_mapper_entities",
+        "_has_orm_entities",
+        "_no_yield_pers",
+        "_joinpath",
+        "_joinpoint",
+        "_join_entities",
+        "multi_row_eager_loaders",
+        "compound_eager_adapter",
+        "extra_criteria_entities",
+        "eager_joins",
+        "eager_order_by",
+        "primary_columns",
+        "secondary_columns",
+        "create_eager_joins",
+        "_fallback_from_clauses",
+        "_current_adapter",
+        "_where_criteria",
+        "_having_criteria",
+        "order_by",
+        "group_by",
+        "distinct",
+        "distinct_on",
+        "correlate",
+        "correlate_except",
+        "dedupe_cols",
+        "_for_update_arg",
+    )
 
-    correlate = None
-    correlate_except = None
-    _where_criteria = ()
-    _having_criteria = ()
+    def _init_defaults(self):
+        self._entities = []
+        self._primary_entity = None
+        self._aliased_generations = {}
+        self._polymorphic_adapters = {}
+        self._no_yield_pers = None
+        # note this is a dictionary, but the
+        # default_compile_options._with_polymorphic_adapt_map is a tuple
+        self._with_polymorphic_adapt_map = _EMPTY_DICT
+        self._joinpath = self._joinpoint = _EMPTY_DICT
+        self._from_obj_alias = None
+        self._has_mapper_entities = False
+        self._has_orm_entities = False
+        self.multi_row_eager_loaders = False
+        self.compound_eager_adapter = None
+        self.current_path = _path_registry
+        self.correlate = None
+        self.correlate_except = None
+        self._where_criteria = ()
+        self._having_criteria = ()
 
     @classmethod
     def create_for_statement(cls, statement, compiler, **kw):
         """compiler hook, we arrive here from compiler.visit_select() only."""
 
         self = cls.__new__(cls)
+        self._init_defaults()
 
         if compiler is not None:
             toplevel = not compiler.stack
@@ -529,12 +644,6 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             select_statement._compile_options._use_legacy_query_style
         )
 
-        self._entities = []
-        self._primary_entity = None
-        self._aliased_generations = {}
-        self._polymorphic_adapters = {}
-        self._no_yield_pers = set()
-
         # legacy: only for query.with_polymorphic()
         if select_statement._compile_options._with_polymorphic_adapt_map:
             self._with_polymorphic_adapt_map = dict(
@@ -549,9 +658,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             # if "for_statement" mode is set, Query.subquery()
             # would have set this flag to False already if that's what's
             # desired
-            self.compile_options += {
-                "_enable_eagerloads": False,
-            }
+            self.compile_options += _disable_eagerloads
 
         # determine label style.   we can make different decisions here.
         # at the moment, trying to see if we can always use DISAMBIGUATE_ONLY
@@ -604,9 +711,12 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         # potentially more complex sets of FROM objects here as the use
         # of lambda statements for lazyload, load_on_pk etc. uses more
         # cloning of the select() construct.  See #6495
-        self.from_clauses = self._normalize_froms(
-            info.selectable for info in select_statement._from_obj
-        )
+        if select_statement._from_obj:
+            self.from_clauses = self._normalize_froms(
+                info.selectable for info in select_statement._from_obj
+            )
+        else:
+            self.from_clauses = []
 
         # this is a fairly arbitrary break into a second method,
         # so it might be nicer to break up create_for_statement()
@@ -621,7 +731,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         query = self.select_statement
 
         self.statement = None
-        self._join_entities = ()
+        self._join_entities = []
 
         if self.compile_options._set_base_alias:
             self._set_select_from_alias()
@@ -632,69 +742,72 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         if query._legacy_setup_joins:
             self._legacy_join(query._legacy_setup_joins)
 
+        # the set of adapters is complete once joins are processed; store
+        # the adapter so that entities don't each build their own
         current_adapter = self._get_current_adapter()
+        self._current_adapter = current_adapter
 
-        if query._where_criteria:
+        if current_adapter is None:
+            # common case; no aliasing of the statement's criteria and
+            # column lists is needed
             self._where_criteria = query._where_criteria
-
-            if current_adapter:
+            self._having_criteria = query._having_criteria
+            self.order_by = query._order_by_clauses
+            self.group_by = query._group_by_clauses or None
+            self.distinct_on = query._distinct_on
+        else:
+            if query._where_criteria:
                 self._where_criteria = tuple(
                     current_adapter(crit, True)
-                    for crit in self._where_criteria
+                    for crit in query._where_criteria
                 )
 
-        # TODO: some complexity with order_by here was due to mapper.order_by.
-        # now that this is removed we can hopefully make order_by /
-        # group_by act identically to how they are in Core select.
-        self.order_by = (
-            self._adapt_col_list(query._order_by_clauses, current_adapter)
-            if current_adapter and query._order_by_clauses not in (None, False)
-            else query._order_by_clauses
-        )
-
-        if query._having_criteria:
-            self._having_criteria = tuple(
-                current_adapter(crit, True) if current_adapter else crit
-                for crit in query._having_criteria
+            # TODO: some complexity with order_by here was due to
+            # mapper.order_by.  now that this is removed we can hopefully
+            # make order_by / group_by act identically to how they are in
+            # Core select.
+            self.order_by = (
+                self._adapt_col_list(query._order_by_clauses, current_adapter)
+                if query._order_by_clauses not in (None, False)
+                else query._order_by_clauses
             )
 
-        self.group_by = (
-            self._adapt_col_list(
-                util.flatten_iterator(query._group_by_clauses), current_adapter
+            if query._having_criteria:
+                self._having_criteria = tuple(
+                    current_adapter(crit, True)
+                    for crit in query._having_criteria
+                )
+
+            self.group_by = (
+                self._adapt_col_list(
+                    util.flatten_iterator(query._group_by_clauses),
+                    current_adapter,
+                )
+                if query._group_by_clauses not in (None, False)
+                else query._group_by_clauses or None
             )
-            if current_adapter and query._group_by_clauses not in (None, False)
-            else query._group_by_clauses or None
-        )
+
+            if query._distinct_on:
+                self.distinct_on = self._adapt_col_list(
+                    query._distinct_on, current_adapter
+                )
+            else:
+                self.distinct_on = ()
 
         if self.eager_order_by:
             adapter = self.from_clauses[0]._target_adapter
             self.eager_order_by = adapter.copy_and_process(self.eager_order_by)
 
-        if query._distinct_on:
-            self.distinct_on = self._adapt_col_list(
-                query._distinct_on, current_adapter
-            )
-        else:
-            self.distinct_on = ()
-
         self.distinct = query._distinct
 
         if query._correlate:
             # ORM mapped entities that are mapped to joins can be passed
             # to .correlate, so here they are broken into their component
             # tables.
-            self.correlate = tuple(
-                util.flatten_iterator(
-                    sql_util.surface_selectables(s) if s is not None else None
-                    for s in query._correlate
-                )
-            )
+            self.correlate = _surface_correlate_selectables(query._correlate)
         elif query._correlate_except:
-            self.correlate_except = tuple(
-                util.flatten_iterator(
-                    sql_util.surface_selectables(s) if s is not None else None
-                    for s in query._correlate_except
-                )
+            self.correlate_except = _surface_correlate_selectables(
+                query._correlate_except
             )
         elif not query._auto_correlate:
             self.correlate = (None,)
@@ -760,11 +873,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
 
         """
         self = cls.__new__(cls)
-
-        self._entities = []
-        self._primary_entity = None
-        self._aliased_generations = {}
-        self._polymorphic_adapters = {}
+        self._init_defaults()
 
         compile_options = cls.default_compile_options.safe_merge(
             query._compile_options
@@ -801,9 +910,12 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
 
     @classmethod
     def exported_columns_iterator(cls, statement):
+        # Select._all_selected_columns is memoized on the statement, so the
+        # entity_namespace dispatch in all_selected_columns() runs only once
+        # per statement
         return (
             elem
-            for elem in cls.all_selected_columns(statement)
+            for elem in statement._all_selected_columns
             if not elem._is_text_clause
         )
 
@@ -860,7 +972,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
 
         adapter = self._get_select_from_alias_from_obj(query._from_obj[0])
         if adapter:
-            self.compile_options += {"_enable_single_crit": False}
+            self.compile_options += _disable_single_crit
             self._from_obj_alias = adapter
 
     def _get_select_from_alias_from_obj(self, from_obj):
@@ -954,7 +1066,9 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         # put FOR UPDATE on the inner query, where MySQL will honor it,
         # as well as if it has an OF so PostgreSQL can use it.
         inner = self._select_statement(
-            util.unique_list(self.primary_columns + order_by_col_expr)
+            util.unique_list(
+                itertools.chain(self.primary_columns, order_by_col_expr)
+            )
             if self.dedupe_cols
             else (self.primary_columns + order_by_col_expr),
             self.from_clauses,
@@ -1033,11 +1147,20 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                 )
             self.primary_columns += to_add
 
+        if self.eager_joins:
+            from_obj = tuple(
+                itertools.chain(self.from_clauses, self.eager_joins.values())
+            )
+        else:
+            from_obj = tuple(self.from_clauses)
+
         statement = self._select_statement(
-            util.unique_list(self.primary_columns + self.secondary_columns)
+            util.unique_list(
+                itertools.chain(self.primary_columns, self.secondary_columns)
+            )
             if self.dedupe_cols
             else (self.primary_columns + self.secondary_columns),
-            tuple(self.from_clauses) + tuple(self.eager_joins.values()),
+            from_obj,
             self._where_criteria,
             self._having_criteria,
             self.label_style,
@@ -1088,16 +1211,18 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         if having_criteria:
             statement._having_criteria = having_criteria
 
+        # the statement is brand new, so collections that default to an
+        # empty tuple on the class can be assigned directly
         if order_by:
-            statement._order_by_clauses += tuple(order_by)
+            statement._order_by_clauses = tuple(order_by)
 
         if distinct_on:
             statement.distinct.non_generative(statement, *distinct_on)
         elif distinct:
-            statement.distinct.non_generative(statement)
+            statement._distinct = True
 
         if group_by:
-            statement._group_by_clauses += tuple(group_by)
+            statement._group_by_clauses = tuple(group_by)
 
         statement._limit_clause = limit_clause
         statement._offset_clause = offset_clause
@@ -1126,29 +1251,34 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         return statement
 
     def _adapt_polymorphic_element(self, element):
-        if "parententity" in element._annotations:
-            search = element._annotations["parententity"]
-            alias = self._polymorphic_adapters.get(search, None)
+        polymorphic_adapters = self._polymorphic_adapters
+
+        search = element._annotations.get("parententity", None)
+        if search is not None:
+            alias = polymorphic_adapters.get(search, None)
             if alias:
                 return alias.adapt_clause(element)
 
         if isinstance(element, expression.FromClause):
             search = element
-        elif hasattr(element, "table"):
-            search = element.table
         else:
-            return None
+            search = getattr(element, "table", None)
+            if search is None:
+                return None
 
-        alias = self._polymorphic_adapters.get(search, None)
+        alias = polymorphic_adapters.get(search, None)
         if alias:
             return alias.adapt_clause(element)
 
     def _adapt_aliased_generation(self, element):
         # this is crazy logic that I look forward to blowing away
         # when aliased=True is gone :)
-        if "aliased_generation" in element._annotations:
+        aliased_generation = element._annotations.get(
+            "aliased_generation", None
+        )
+        if aliased_generation is not None:
             for adapter in self._aliased_generations.get(
-                element._annotations["aliased_generation"], ()
+                aliased_generation, ()
             ):
                 replaced_elem = adapter.replace(element)
                 if replaced_elem is not None:
@@ -1192,14 +1322,30 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
         if not adapters:
             return None
 
-        def _adapt_clause(clause, as_filter):
-            # do we adapt all expression elements or only those
-            # tagged as 'ORM' constructs ?
+        # do we adapt all expression elements or only those
+        # tagged as 'ORM' constructs ?
+        if len(adapters) == 1:
+            # single adapter, the common case
+            always_adapt, adapter = adapters[0]
+            if always_adapt:
+                replace = adapter
+            else:
+
+                def replace(elem):
+                    annotations = elem._annotations
+                    if (
+                        "_orm_adapt" in annotations
+                        or "parententity" in annotations
+                    ):
+                        return adapter(elem)
+
+        else:
 
             def replace(elem):
+                annotations = elem._annotations
                 is_orm_adapt = (
-                    "_orm_adapt" in elem._annotations
-                    or "parententity" in elem._annotations
+                    "_orm_adapt" in annotations
+                    or "parententity" in annotations
                 )
                 for always_adapt, adapter in adapters:
                     if is_orm_adapt or always_adapt:
@@ -1207,6 +1353,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                         if e is not None:
                             return e
 
+        def _adapt_clause(clause, as_filter):
             return visitors.replacement_traverse(clause, {}, replace)
 
         return _adapt_clause
@@ -1391,9 +1538,10 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                 # string given, e.g. query(Foo).join("bar").
                 # we look to the left entity or what we last joined
                 # towards
-                onclause = _entity_namespace_key(
-                    inspect(self._joinpoint_zero()), onclause
-                )
+                jp0 = self._joinpoint.get("_joinpoint_entity", None)
+                if jp0 is None:
+                    jp0 = self._entity_zero()
+                onclause = _entity_namespace_key(inspect(jp0), onclause)
 
             # legacy vvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
             # check for q.join(Class.propname, from_joinpoint=True)
@@ -1408,7 +1556,9 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             elif from_joinpoint and isinstance(
                 onclause, interfaces.PropComparator
             ):
-                jp0 = self._joinpoint_zero()
+                jp0 = self._joinpoint.get("_joinpoint_entity", None)
+                if jp0 is None:
+                    jp0 = self._entity_zero()
                 info = inspect(jp0)
 
                 if getattr(info, "mapper", None) is onclause._parententity:
@@ -1484,9 +1634,6 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                 full,
             )
 
-    def _joinpoint_zero(self):
-        return self._joinpoint.get("_joinpoint_entity", self._entity_zero())
-
     def _join_left_to_right(
         self,
         left,
@@ -1547,19 +1694,13 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             # self._from_obj list
             left_clause = self.from_clauses[replace_from_obj_index]
 
-            self.from_clauses = (
-                self.from_clauses[:replace_from_obj_index]
-                + [
-                    _ORMJoin(
-                        left_clause,
-                        right,
-                        onclause,
-                        isouter=outerjoin,
-                        full=full,
-                        _extra_criteria=extra_criteria,
-                    )
-                ]
-                + self.from_clauses[replace_from_obj_index + 1 :]
+            self.from_clauses[replace_from_obj_index] = _ORMJoin(
+                left_clause,
+                right,
+                onclause,
+                isouter=outerjoin,
+                full=full,
+                _extra_criteria=extra_criteria,
             )
         else:
             # add a new element to the self._from_obj list
@@ -1574,7 +1715,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             else:
                 left_clause = left
 
-            self.from_clauses = self.from_clauses + [
+            self.from_clauses.append(
                 _ORMJoin(
                     left_clause,
                     r_info,
@@ -1583,7 +1724,7 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                     full=full,
                     _extra_criteria=extra_criteria,
                 )
-            ]
+            )
 
     def _join_determine_implicit_left_side(self, left, right, onclause):
         """When join conditions don't express the left side explicitly,
@@ -1777,11 +1918,21 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                 right_mapper.with_polymorphic
                 or isinstance(right_mapper.persist_selectable, expression.Join)
             ):
+                # gather the surface selectables of each side once, rather
+                # than once per FROM via selectables_overlap()
+                l_surface = set(
+                    sql_util.surface_selectables(l_info.selectable)
+                )
+                r_surface = set(
+                    sql_util.surface_selectables(r_info.selectable)
+                )
                 for from_obj in self.from_clauses or [l_info.selectable]:
-                    if sql_util.selectables_overlap(
-                        l_info.selectable, from_obj
-                    ) and sql_util.selectables_overlap(
-                        from_obj, r_info.selectable
+                    from_surface = set(
+                        sql_util.surface_selectables(from_obj)
+                    )
+                    if not (
+                        from_surface.isdisjoint(l_surface)
+                        or from_surface.isdisjoint(r_surface)
                     ):
                         overlap = True
                         break
@@ -1812,8 +1963,8 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
 
         # _join_entities is used as a hint for single-table inheritance
         # purposes at the moment
-        if hasattr(r_info, "mapper"):
-            self._join_entities += (r_info,)
+        if right_mapper is not None:
+            self._join_entities.append(r_info)
 
         need_adapter = False
 
@@ -2035,9 +2186,10 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                     ext_info._adapter if ext_info.is_aliased_class else None,
                 )
 
-        search = set(self.extra_criteria_entities.values())
+        current_adapter = self._current_adapter
 
-        for (ext_info, adapter) in search:
+        # entries are keyed on ext_info, so the values are already unique
+        for (ext_info, adapter) in self.extra_criteria_entities.values():
             if ext_info in self._join_entities:
                 continue
 
@@ -2048,7 +2200,6 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
             if single_crit is not None:
                 additional_entity_criteria += (single_crit,)
 
-            current_adapter = self._get_current_adapter()
             for crit in additional_entity_criteria:
                 if adapter:
                     crit = adapter.traverse(crit)
@@ -2059,6 +2210,16 @@ class ORMSelectCompileState(ORMCompileState, SelectState):
                 self._where_criteria += (crit,)
 
 
+def _surface_correlate_selectables(elements):
+    correlate = []
+    for elem in elements:
+        if elem is None:
+            correlate.append(None)
+        else:
+            correlate.extend(sql_util.surface_selectables(elem))
+    return tuple(correlate)
+
+
 def _column_descriptions(
     query_or_select_stmt, compile_state=None, legacy=False
 ):
@@ -2066,29 +2227,30 @@ def _column_descriptions(
         compile_state = ORMSelectCompileState._create_entities_collection(
             query_or_select_stmt, legacy=legacy
         )
-    ctx = compile_state
-    return [
-        {
-            "name": ent._label_name,
-            "type": ent.type,
-            "aliased": getattr(insp_ent, "is_aliased_class", False),
-            "expr": ent.expr,
-            "entity": getattr(insp_ent, "entity", None)
-            if ent.entity_zero is not None and not insp_ent.is_clause_element
-            else None,
-        }
-        for ent, insp_ent in [
-            (
-                _ent,
-                (
-                    inspect(_ent.entity_zero)
-                    if _ent.entity_zero is not None
-                    else None
-                ),
+    descriptions = []
+    for ent in compile_state._entities:
+        if ent.entity_zero is not None:
+            insp_ent = inspect(ent.entity_zero)
+            aliased = getattr(insp_ent, "is_aliased_class", False)
+            entity = (
+                getattr(insp_ent, "entity", None)
+                if not insp_ent.is_clause_element
+                else None
             )
-            for _ent in ctx._entities
-        ]
-    ]
+        else:
+            aliased = False
+            entity = None
+
+        descriptions.append(
+            {
+                "name": ent._label_name,
+                "type": ent.type,
+                "aliased": aliased,
+                "expr": ent.expr,
+                "entity": entity,
+            }
+        )
+    return descriptions
 
 
 def _legacy_filter_by_entity_zero(query_or_augmented_select):
@@ -2098,8 +2260,12 @@ def _legacy_filter_by_entity_zero(query_or_augmented_select):
         if _last_joined_entity is not None:
             return _last_joined_entity
 
-    if self._from_obj and "parententity" in self._from_obj[0]._annotations:
-        return self._from_obj[0]._annotations["parententity"]
+    if self._from_obj:
+        parententity = self._from_obj[0]._annotations.get(
+            "parententity", None
+        )
+        if parententity is not None:
+            return parententity
 
     return _entity_from_pre_ent_zero(self)
 
@@ -2110,13 +2276,17 @@ def _entity_from_pre_ent_zero(query_or_augmented_select):
         return None
 
     ent = self._raw_columns[0]
+    annotations = ent._annotations
 
-    if "parententity" in ent._annotations:
-        return ent._annotations["parententity"]
+    parententity = annotations.get("parententity", None)
+    if parententity is not None:
+        return parententity
     elif isinstance(ent, ORMColumnsClauseRole):
         return ent.entity
-    elif "bundle" in ent._annotations:
-        return ent._annotations["bundle"]
+
+    bundle = annotations.get("bundle", None)
+    if bundle is not None:
+        return bundle
     else:
         return ent
 
@@ -2242,6 +2412,7 @@ class _MapperEntity(_QueryEntity):
         "_with_polymorphic_mappers",
         "selectable",
         "_polymorphic_discriminator",
+        "_row_adapter",
     )
 
     def __init__(self, compile_state, entity):
@@ -2343,8 +2514,15 @@ class _MapperEntity(_QueryEntity):
 
         return ret
 
-    def row_processor(self, context, result):
-        compile_state = context.compile_state
+    def _get_row_adapter(self, compile_state):
+        # the compile state is complete by the time rows are processed
+        # and is reused for each execution of a cached statement, so
+        # build the (possibly wrapped) adapter for rows only once
+        try:
+            return self._row_adapter
+        except AttributeError:
+            pass
+
         adapter = self._get_entity_clauses(compile_state)
 
         if compile_state.compound_eager_adapter and adapter:
@@ -2352,6 +2530,13 @@ class _MapperEntity(_QueryEntity):
         elif not adapter:
             adapter = compile_state.compound_eager_adapter
 
+        self._row_adapter = adapter
+        return adapter
+
+    def row_processor(self, context, result):
+        compile_state = context.compile_state
+        adapter = self._get_row_adapter(compile_state)
+
         if compile_state._primary_entity is self:
             only_load_props = compile_state.compile_options._only_load_props
             refresh_state = context.refresh_state
@@ -2383,10 +2568,11 @@ class _MapperEntity(_QueryEntity):
             in compile_state.global_attributes
         ):
             ext_info = self.entity_zero
-            compile_state.extra_criteria_entities[ext_info] = (
-                ext_info,
-                ext_info._adapter if ext_info.is_aliased_class else None,
-            )
+            if ext_info not in compile_state.extra_criteria_entities:
+                compile_state.extra_criteria_entities[ext_info] = (
+                    ext_info,
+                    ext_info._adapter if ext_info.is_aliased_class else None,
+                )
 
         loading._setup_entity_query(
             compile_state,
@@ -2415,6 +2601,8 @@ class _BundleEntity(_QueryEntity):
         "_label_name",
         "_entities",
         "supports_single_entity",
+        "entity_zero",
+        "entity_zero_or_selectable",
     )
 
     def __init__(
@@ -2451,6 +2639,18 @@ class _BundleEntity(_QueryEntity):
                         compile_state, [expr], None, parent_bundle=self
                     )
 
+        # the sub-entities are complete at this point, so locate the
+        # first entity / selectable among them once
+        self.entity_zero = self.entity_zero_or_selectable = None
+        for ent in self._entities:
+            if ent.entity_zero is not None:
+                self.entity_zero = ent.entity_zero
+                break
+        for ent in self._entities:
+            if ent.entity_zero_or_selectable is not None:
+                self.entity_zero_or_selectable = ent.entity_zero_or_selectable
+                break
+
         self.supports_single_entity = self.bundle.single_entity
         if (
             self.supports_single_entity
@@ -2469,29 +2669,11 @@ class _BundleEntity(_QueryEntity):
         else:
             return None
 
-    @property
-    def entity_zero(self):
-        for ent in self._entities:
-            ezero = ent.entity_zero
-            if ezero is not None:
-                return ezero
-        else:
-            return None
-
     def corresponds_to(self, entity):
         # TODO: we might be able to implement this but for now
         # we are working around it
         return False
 
-    @property
-    def entity_zero_or_selectable(self):
-        for ent in self._entities:
-            ezero = ent.entity_zero_or_selectable
-            if ezero is not None:
-                return ezero
-        else:
-            return None
-
     def setup_compile_state(self, compile_state):
         for ent in self._entities:
             ent.setup_compile_state(compile_state)
@@ -2528,7 +2710,7 @@ class _ColumnEntity(_QueryEntity):
                 )
 
             if _entity:
-                if "identity_token" in column._annotations:
+                if "identity_token" in annotations:
                     _IdentityTokenEntity(
                         compile_state,
                         column,
@@ -2656,7 +2838,7 @@ class _RawColumnEntity(_ColumnEntity):
         return False
 
     def setup_compile_state(self, compile_state):
-        current_adapter = compile_state._get_current_adapter()
+        current_adapter = compile_state._current_adapter
         if current_adapter:
             column = current_adapter(self.column, False)
         else:
@@ -2758,7 +2940,7 @@ class _ORMColumnEntity(_ColumnEntity):
             ) and entity.common_parent(self.entity_zero)
 
     def setup_compile_state(self, compile_state):
-        current_adapter = compile_state._get_current_adapter()
+        current_adapter = compile_state._current_adapter
         if current_adapter:
             column = current_adapter(self.column, False)
         else:
@@ -2771,7 +2953,7 @@ class _ORMColumnEntity(_ColumnEntity):
             single_table_crit is not None
             or ("additional_entity_criteria", self.mapper)
             in compile_state.global_attributes
-        ):
+        ) and ezero not in compile_state.extra_criteria_entities:
 
             compile_state.extra_criteria_entities[ezero] = (
                 ezero,
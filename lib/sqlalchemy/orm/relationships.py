@@ -50,6 +50,9 @@ from ..sql.util import selectables_overlap
 from ..sql.util import visit_binary_product
 
 
+_comma_sep_re = re.compile(r"\s*,\s*")
+
+
 def remote(expr):
     """Annotate a portion of a primaryjoin expression
     with a 'remote' annotation.
@@ -1031,7 +1034,6 @@ class RelationshipProperty(StrategizedProperty):
         self.comparator_factory = (
             comparator_factory or RelationshipProperty.Comparator
         )
-        self.comparator = self.comparator_factory(self, None)
         util.set_creation_order(self)
 
         if info is not None:
@@ -1039,9 +1041,10 @@ class RelationshipProperty(StrategizedProperty):
 
         self.strategy_key = (("lazy", self.lazy),)
 
-        self._reverse_property = set()
+        # replaced with a set if a reverse property is established
+        self._reverse_property = util.EMPTY_SET
         if overlaps:
-            self._overlaps = set(re.split(r"\s*,\s*", overlaps))
+            self._overlaps = frozenset(_comma_sep_re.split(overlaps))
         else:
             self._overlaps = ()
 
@@ -1084,6 +1087,10 @@ class RelationshipProperty(StrategizedProperty):
                     "in a future release." % (k,)
                 )
 
+    @util.memoized_property
+    def comparator(self):
+        return self.comparator_factory(self, None)
+
     def instrument_class(self, mapper):
         attributes.register_descriptor(
             mapper.class_,
@@ -1093,7 +1100,7 @@ class RelationshipProperty(StrategizedProperty):
             doc=self.doc,
         )
 
-    class Comparator(PropComparator):
+    class Comparator(util.MemoizedSlots, PropComparator):
         """Produce boolean, comparison, and other operators for
         :class:`.RelationshipProperty` attributes.
 
@@ -1114,8 +1121,13 @@ class RelationshipProperty(StrategizedProperty):
 
         """
 
-        _of_type = None
-        _extra_criteria = ()
+        __slots__ = (
+            "entity",
+            "mapper",
+            "_of_type",
+            "_of_type_entity",
+            "_extra_criteria",
+        )
 
         def __init__(
             self,
@@ -1132,10 +1144,15 @@ class RelationshipProperty(StrategizedProperty):
             self.prop = prop
             self._parententity = parentmapper
             self._adapt_to_entity = adapt_to_entity
-            if of_type:
-                self._of_type = of_type
+            self._of_type = of_type if of_type else None
             self._extra_criteria = extra_criteria
 
+        def _memoized_attr__of_type(self):
+            return None
+
+        def _memoized_attr__extra_criteria(self):
+            return ()
+
         def adapt_to_entity(self, adapt_to_entity):
             return self.__class__(
                 self.property,
@@ -1144,8 +1161,7 @@ class RelationshipProperty(StrategizedProperty):
                 of_type=self._of_type,
             )
 
-        @util.memoized_property
-        def entity(self):
+        def _memoized_attr_entity(self):
             """The target entity referred to by this
             :class:`.RelationshipProperty.Comparator`.
 
@@ -1158,8 +1174,7 @@ class RelationshipProperty(StrategizedProperty):
             """
             return self.property.entity
 
-        @util.memoized_property
-        def mapper(self):
+        def _memoized_attr_mapper(self):
             """The target :class:`_orm.Mapper` referred to by this
             :class:`.RelationshipProperty.Comparator`.
 
@@ -1169,10 +1184,15 @@ class RelationshipProperty(StrategizedProperty):
             """
             return self.property.mapper
 
-        @util.memoized_property
-        def _parententity(self):
+        def _memoized_attr__parententity(self):
             return self.property.parent
 
+        def _memoized_attr__of_type_entity(self):
+            if self._of_type:
+                return inspect(self._of_type)
+            else:
+                return None
+
         def _source_selectable(self):
             if self._adapt_to_entity:
                 return self._adapt_to_entity.selectable
@@ -1181,10 +1201,7 @@ class RelationshipProperty(StrategizedProperty):
 
         def __clause_element__(self):
             adapt_from = self._source_selectable()
-            if self._of_type:
-                of_type_entity = inspect(self._of_type)
-            else:
-                of_type_entity = None
+            of_type_entity = self._of_type_entity
 
             (
                 pj,
@@ -1287,7 +1304,7 @@ class RelationshipProperty(StrategizedProperty):
               or many-to-many context produce a NOT EXISTS clause.
 
             """
-            if isinstance(other, (util.NoneType, expression.Null)):
+            if other is None or isinstance(other, expression.Null):
                 if self.property.direction in [ONETOMANY, MANYTOMANY]:
                     return ~self._criterion_exists()
                 else:
@@ -1310,7 +1327,7 @@ class RelationshipProperty(StrategizedProperty):
 
         def _criterion_exists(self, criterion=None, **kwargs):
             if getattr(self, "_of_type", None):
-                info = inspect(self._of_type)
+                info = self._of_type_entity
                 target_mapper, to_selectable, is_aliased_class = (
                     info.mapper,
                     info.selectable,
@@ -1378,8 +1395,9 @@ class RelationshipProperty(StrategizedProperty):
                 criterion = criterion._annotate(
                     {"no_replacement_traverse": True}
                 )
-
-            crit = j & sql.True_._ifnone(criterion)
+                crit = j & criterion
+            else:
+                crit = j
 
             if secondary is not None:
                 ex = (
@@ -1637,7 +1655,7 @@ class RelationshipProperty(StrategizedProperty):
               or many-to-many context produce an EXISTS clause.
 
             """
-            if isinstance(other, (util.NoneType, expression.Null)):
+            if other is None or isinstance(other, expression.Null):
                 if self.property.direction == MANYTOONE:
                     return _orm_annotate(
                         ~self.property._optimized_compare(
@@ -1656,8 +1674,7 @@ class RelationshipProperty(StrategizedProperty):
             else:
                 return _orm_annotate(self.__negated_contains_or_equals(other))
 
-        @util.memoized_property
-        def property(self):
+        def _memoized_attr_property(self):
             self.prop.parent._check_configure()
             return self.prop
 
@@ -2063,8 +2080,10 @@ class RelationshipProperty(StrategizedProperty):
         #    self.sync_backref==None -> warn sync_backref=False, set to False
         self._check_sync_backref(other, self)
 
-        self._reverse_property.add(other)
-        other._reverse_property.add(self)
+        for prop, reverse in ((self, other), (other, self)):
+            if prop._reverse_property is util.EMPTY_SET:
+                prop._reverse_property = set()
+            prop._reverse_property.add(reverse)
 
         if not other.mapper.common_parent(self.parent):
             raise sa_exc.ArgumentError(
@@ -2139,6 +2158,7 @@ class RelationshipProperty(StrategizedProperty):
         self._setup_join_conditions()
         self._check_cascade_settings(self._cascade)
         self._post_init()
+        self._check_lazy_settings()
         self._generate_backref()
         self._join_condition._warn_for_conflicting_sync_targets()
         super(RelationshipProperty, self).do_init()
@@ -2372,6 +2392,45 @@ class RelationshipProperty(StrategizedProperty):
                 (self.key, self.parent.class_)
             )
 
+        if (
+            cascade.delete
+            and not self.passive_deletes
+            and self.direction is ONETOMANY
+            and self._should_log_info()
+            and self._has_ondelete_cascade_fk()
+        ):
+            self.logger.info(
+                "%s has delete cascade and its foreign key specifies "
+                "ON DELETE CASCADE; passive_deletes=True would allow "
+                "the database to delete child rows without loading them",
+                self,
+            )
+
+    def _check_lazy_settings(self):
+        if (
+            self.lazy in ("joined", False)
+            and self.uselist
+            and self._should_log_info()
+        ):
+            self.logger.info(
+                "%s is a collection using lazy='joined'; each parent row "
+                "is repeated once per related row in the result, "
+                "lazy='selectin' loads the collection with a separate "
+                "SELECT instead",
+                self,
+            )
+
+    def _has_ondelete_cascade_fk(self):
+        """Return True if the foreign key columns on the remote side of
+        a one-to-many relationship are constrained with ON DELETE CASCADE.
+
+        """
+        for _, remote in self.synchronize_pairs:
+            for fk in remote.foreign_keys:
+                if fk.ondelete and fk.ondelete.upper() == "CASCADE":
+                    return True
+        return False
+
     def _persists_for(self, mapper):
         """Return True if this property will persist values on behalf
         of the given mapper.
@@ -2579,6 +2638,11 @@ class RelationshipProperty(StrategizedProperty):
 
 
 def _annotate_columns(element, annotations):
+    if isinstance(element, expression.ColumnClause):
+        # common case of remote(col) / foreign(col); a column has no
+        # inner elements to annotate, so skip the traversal
+        return element._annotate(annotations.copy())
+
     def clone(elem):
         if isinstance(elem, expression.ColumnClause):
             elem = elem._annotate(annotations.copy())
@@ -123,8 +123,23 @@ class CascadeOptions(frozenset):
 
     @classmethod
     def from_string(cls, arg):
+        # most relationships use one of a handful of cascade strings;
+        # as the result is immutable, share it among them
+        cascade = _cascade_string_cache.get(arg)
+        if cascade is not None:
+            return cascade
+
         values = [c for c in re.split(r"\s*,\s*", arg or "") if c]
-        return cls(values)
+        cascade = cls(values)
+
+        # don't cache settings that warn, so that each relationship
+        # using them still emits the warning
+        if not cascade.delete_orphan or cascade.delete:
+            _cascade_string_cache[arg] = cascade
+        return cascade
+
+
+_cascade_string_cache = util.LRUCache(100)
 
 
 def _validator_events(desc, key, validator, include_removes, include_backrefs):
@@ -338,16 +338,16 @@ def expand_column_list_from_order_by(collist, order_by):
     in the collist.
 
     """
-    cols_already_present = set(
-        [
-            col.element if col._order_by_label_element is not None else col
-            for col in collist
-        ]
-    )
-
-    to_look_for = list(chain(*[unwrap_order_by(o) for o in order_by]))
-
-    return [col for col in to_look_for if col not in cols_already_present]
+    cols_already_present = {
+        col.element if col._order_by_label_element is not None else col
+        for col in collist
+    }
+
+    return [
+        col
+        for col in chain.from_iterable(unwrap_order_by(o) for o in order_by)
+        if col not in cols_already_present
+    ]
 
 
 def clause_is_present(clause, search):
@@ -1144,7 +1144,6 @@ class BranchedOptionTest(NoCache, fixtures.MappedTest):
         @profiling.function_call_count(warmup=1)
         def go():
             q2 = q.options(opts)
-            context.query = q2
             context.attributes = q2._attributes = {
                 "_unbound_load_dedupes": set()
             }
@@ -1171,7 +1170,6 @@ class BranchedOptionTest(NoCache, fixtures.MappedTest):
         @profiling.function_call_count(warmup=1)
         def go():
             q2 = q.options(opts)
-            context.query = q2
             context.attributes = q2._attributes = {
                 "_unbound_load_dedupes": set()
             }
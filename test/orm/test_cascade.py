@@ -27,6 +27,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import not_in
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.fixtures import fixture_session
@@ -126,6 +127,12 @@ class CascadeArgTest(fixtures.MappedTest):
             orm_util.CascadeOptions("all, delete-orphan"), frozenset
         )
 
+    def test_cascade_string_shared(self):
+        is_(
+            orm_util.CascadeOptions("all, delete-orphan"),
+            orm_util.CascadeOptions("all, delete-orphan"),
+        )
+
     def test_cascade_deepcopy(self):
         old = orm_util.CascadeOptions("all, delete-orphan")
         new = copy.deepcopy(old)
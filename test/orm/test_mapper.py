@@ -2669,12 +2669,14 @@ class ORMLoggingTest(_fixtures.FixtureTest):
         self.buf = logging.handlers.BufferingHandler(100)
         for log in [logging.getLogger("sqlalchemy.orm")]:
             log.addHandler(self.buf)
+        self.existing_level = logging.getLogger("sqlalchemy.orm").level
 
         self.mapper = registry().map_imperatively
 
     def teardown_test(self):
         for log in [logging.getLogger("sqlalchemy.orm")]:
             log.removeHandler(self.buf)
+        logging.getLogger("sqlalchemy.orm").setLevel(self.existing_level)
 
     def _current_messages(self):
         return [b.getMessage() for b in self.buf.buffer]
@@ -2690,6 +2692,111 @@ class ORMLoggingTest(_fixtures.FixtureTest):
         for msg in self._current_messages():
             assert msg.startswith("(User|%%(%d anon)s) " % id(tb))
 
+    def _lazy_joined_messages(self):
+        return [
+            msg
+            for msg in self._current_messages()
+            if "is a collection using lazy='joined'" in msg
+        ]
+
+    @testing.combinations(("joined",), (False,), argnames="lazy")
+    def test_lazy_joined_collection_info(self, lazy):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        logging.getLogger("sqlalchemy.orm").setLevel(logging.INFO)
+
+        self.mapper(
+            User,
+            users,
+            properties={"addresses": relationship(Address, lazy=lazy)},
+        )
+        self.mapper(Address, addresses)
+        configure_mappers()
+
+        eq_(len(self._lazy_joined_messages()), 1)
+        assert self._lazy_joined_messages()[0].startswith("User.addresses ")
+
+    def test_lazy_joined_many_to_one_no_info(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+        logging.getLogger("sqlalchemy.orm").setLevel(logging.INFO)
+
+        self.mapper(User, users)
+        self.mapper(
+            Address,
+            addresses,
+            properties={"user": relationship(User, lazy="joined")},
+        )
+        configure_mappers()
+
+        eq_(self._lazy_joined_messages(), [])
+
+    def _passive_deletes_messages(self):
+        return [
+            msg
+            for msg in self._current_messages()
+            if "passive_deletes=True would allow" in msg
+        ]
+
+    @testing.combinations(
+        ("CASCADE", False, True),
+        ("cascade", False, True),
+        ("CASCADE", True, False),
+        (None, False, False),
+        argnames="ondelete, passive_deletes, expected",
+    )
+    def test_ondelete_cascade_info(self, ondelete, passive_deletes, expected):
+        metadata = MetaData()
+        parent = Table(
+            "parent", metadata, Column("id", Integer, primary_key=True)
+        )
+        child = Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column(
+                "parent_id", ForeignKey("parent.id", ondelete=ondelete)
+            ),
+        )
+
+        class Parent(object):
+            pass
+
+        class Child(object):
+            pass
+
+        logging.getLogger("sqlalchemy.orm").setLevel(logging.INFO)
+
+        self.mapper(
+            Parent,
+            parent,
+            properties={
+                "children": relationship(
+                    Child,
+                    cascade="all, delete-orphan",
+                    passive_deletes=passive_deletes,
+                )
+            },
+        )
+        self.mapper(Child, child)
+        configure_mappers()
+
+        if expected:
+            eq_(len(self._passive_deletes_messages()), 1)
+            assert self._passive_deletes_messages()[0].startswith(
+                "Parent.children "
+            )
+        else:
+            eq_(self._passive_deletes_messages(), [])
+
 
 class ComparatorFactoryTest(_fixtures.FixtureTest, AssertsCompiledSQL):
     def test_kwarg_accepted(self):
@@ -2852,6 +2959,62 @@ class ComparatorFactoryTest(_fixtures.FixtureTest, AssertsCompiledSQL):
             dialect=default.DefaultDialect(),
         )
 
+    def test_relationship_subclass_init(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        from sqlalchemy.orm.relationships import RelationshipProperty
+
+        class MyFactory(RelationshipProperty.Comparator):
+            def __init__(
+                self, prop, parentmapper, adapt_to_entity=None, of_type=None
+            ):
+                self.prop = prop
+                self._parententity = parentmapper
+                self._adapt_to_entity = adapt_to_entity
+                if of_type:
+                    self._of_type = of_type
+
+        self.mapper(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, comparator_factory=MyFactory
+                )
+            },
+        )
+        self.mapper(Address, addresses)
+
+        ua = aliased(User)
+        self.assert_compile(
+            ua.addresses.any(),
+            "EXISTS (SELECT 1 FROM users AS users_1, addresses "
+            "WHERE users_1.id = addresses.user_id)",
+            dialect=default.DefaultDialect(),
+        )
+
+        aa = aliased(Address)
+        self.assert_compile(
+            User.addresses.of_type(aa).any(),
+            "EXISTS (SELECT 1 FROM users, addresses AS addresses_1 "
+            "WHERE users.id = addresses_1.user_id)",
+            dialect=default.DefaultDialect(),
+        )
+
+        self.assert_compile(
+            User.addresses.and_(
+                Address.email_address == "x"
+            ).__clause_element__(),
+            "users.id = addresses.user_id "
+            "AND addresses.email_address = :email_address_1",
+            dialect=default.DefaultDialect(),
+        )
+
 
 class RegistryConfigDisposeTest(fixtures.TestBase):
     """test the cascading behavior of registry configure / dispose."""